@@ -48,6 +48,7 @@ type UnifiedContent struct {
 	Text      string        `json:"text,omitempty"`
 	Metadata  ImageMetadata `json:"metadata,omitempty"`
 	ImageData string        `json:"image_data,omitempty"`
+	URI       string        `json:"uri,omitempty"`
 }
 
 type UnifiedSearchResponse struct {
@@ -72,6 +73,7 @@ type ImageResult struct {
 	Score     float64       `json:"score"`
 	Metadata  ImageMetadata `json:"metadata"`
 	ImageData string        `json:"image_data"`
+	URI       string        `json:"uri,omitempty"`
 }
 
 func (c *MLClient) AddDocument(text string) (string, error) {
@@ -1,13 +1,18 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any, Union
 from ..embeddings.model import EmbeddingModel
 from ..embeddings.image_model import ImageModel
+from ..embeddings.batcher import EmbedBatcher
 from ..storage.qdrant_client import QdrantClient
+from ..storage.image_store import ImageStore
 import numpy as np
 import uuid
 import logging
+import mimetypes
+import os
 import io
 import asyncio
 import time
@@ -30,29 +35,51 @@ app.add_middleware(
 # Initialize variables
 text_model = None
 image_model = None
+text_batcher = None
+image_text_batcher = None
 qdrant = None
+image_store = None
 is_ready = False
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
-    global qdrant
+    global qdrant, image_store
+    
+    image_store = ImageStore(os.getenv("IMAGE_STORE_DIR", "/data/images"))
     
     # Initialize Qdrant first
     qdrant = QdrantClient(host="qdrant", port=6333)
+    await qdrant.connect()
     await qdrant.ensure_collections()
     
     # Start model initialization in the background
     asyncio.create_task(initialize_models())
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release service resources on shutdown."""
+    for batcher in (text_batcher, image_text_batcher):
+        if batcher is not None:
+            await batcher.stop()
+    
+    if qdrant is not None:
+        await qdrant.aclose()
+
 async def initialize_models():
     """Initialize models in the background."""
-    global text_model, image_model, is_ready
+    global text_model, image_model, text_batcher, image_text_batcher, is_ready
     
     # Initialize models
-    text_model = EmbeddingModel()
+    text_model = EmbeddingModel(backend=os.getenv("EMBEDDING_BACKEND", "torch"))
     image_model = ImageModel()
     
+    # Collate concurrent single-text requests into batched forward passes
+    text_batcher = EmbedBatcher(text_model.get_embeddings)
+    image_text_batcher = EmbedBatcher(image_model.get_text_embedding)
+    text_batcher.start()
+    image_text_batcher.start()
+    
     is_ready = True
 
 class TextInput(BaseModel):
@@ -132,7 +159,7 @@ class UnifiedSearchResponse(BaseModel):
 async def generate_embedding(input_data: TextInput):
     """Generate embeddings for a single text."""
     try:
-        embedding = text_model.get_embeddings(input_data.text)
+        embedding = await text_batcher.submit(input_data.text)
         return {"embedding": embedding.tolist()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -159,7 +186,7 @@ async def calculate_similarity(input_data: SimilarityInput):
 async def add_document(input_data: DocumentInput):
     """Add a document to the vector store."""
     try:
-        embedding = text_model.get_embeddings(input_data.text)
+        embedding = await text_batcher.submit(input_data.text)
         
         doc_id = str(uuid.uuid4())
         
@@ -186,8 +213,11 @@ async def unified_search(query: str, limit: int = 10, score_threshold: float = 0
     try:
         start_time = time.perf_counter()
         
-        text_embedding = text_model.get_embeddings(query)
-        image_embedding = image_model.get_text_embedding(query)
+        # Run both forward passes concurrently off the event loop
+        text_embedding, image_embedding = await asyncio.gather(
+            text_batcher.submit(query),
+            image_text_batcher.submit(query)
+        )
         
         results = await qdrant.search_multiple_collections(
             embeddings={
@@ -213,10 +243,7 @@ async def unified_search(query: str, limit: int = 10, score_threshold: float = 0
                     "text": result["payload"]["text"]
                 }
             else:  # image
-                processed_result["content"] = {
-                    "metadata": result["payload"]["metadata"],
-                    "image_data": result["payload"]["image_data"]
-                }
+                processed_result["content"] = _image_content(result["payload"])
             
             processed_results.append(processed_result)
         
@@ -229,6 +256,15 @@ async def unified_search(query: str, limit: int = 10, score_threshold: float = 0
         logger.error(f"Error in unified search: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
+def _image_content(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the response content for an image point."""
+    content = {"metadata": payload["metadata"]}
+    # Images stored before the file store carry inline base64 data instead of a URI
+    for key in ("uri", "image_data"):
+        if key in payload:
+            content[key] = payload[key]
+    return content
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -246,31 +282,36 @@ async def health_check():
 async def add_image(image: UploadFile = File(...), description: Optional[str] = None):
     """Add an image to the vector store."""
     try:
-        image_data = await image.read()
+        # Work from the upload's spooled file instead of reading it into memory
+        embedding = await asyncio.to_thread(image_model.get_image_embedding, image.file)
         
-        embedding = image_model.get_image_embedding(image_data)
+        # Trust the file signature, not the client's declared type; it picks
+        # the stored extension and so the type the image is served with
+        content_type = await asyncio.to_thread(image_model.detect_mime_type, image.file)
         
         doc_id = str(uuid.uuid4())
         
         metadata = {
             "filename": image.filename,
-            "content_type": image.content_type,
+            "content_type": content_type,
             "description": description
         }
         
-        image_base64 = image_model.encode_image_base64(image_data)
+        # Keep the bytes on disk; the point only references them
+        filename = await asyncio.to_thread(image_store.save, doc_id, image.file, content_type)
         
         success = await qdrant.add_document(
             collection_name="images",
             document_id=doc_id,
             embedding=embedding,
             payload={
-                "image_data": image_base64,
+                "uri": f"/images/{filename}",
                 "metadata": metadata
             }
         )
         
         if not success:
+            await asyncio.to_thread(image_store.delete, filename)
             raise HTTPException(status_code=500, detail="Failed to store image")
             
         return {
@@ -286,9 +327,7 @@ async def add_image(image: UploadFile = File(...), description: Optional[str] =
 async def find_similar_images(image: UploadFile = File(...), limit: int = 10, score_threshold: float = 0.5):
     """Find similar images to the uploaded image."""
     try:
-        image_data = await image.read()
-        
-        query_embedding = image_model.get_image_embedding(image_data)
+        query_embedding = await asyncio.to_thread(image_model.get_image_embedding, image.file)
         
         results = await qdrant.search_documents(
             collection_name="images",
@@ -302,8 +341,7 @@ async def find_similar_images(image: UploadFile = File(...), limit: int = 10, sc
             processed_results.append({
                 "id": result["id"],
                 "score": result["score"],
-                "metadata": result["payload"]["metadata"],
-                "image_data": result["payload"]["image_data"]
+                **_image_content(result["payload"])
             })
         
         return {
@@ -312,4 +350,14 @@ async def find_similar_images(image: UploadFile = File(...), limit: int = 10, sc
         }
     except Exception as e:
         logger.error(f"Error finding similar images: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e)) 
+
+@app.get("/images/{filename}")
+async def get_image(filename: str):
+    """Serve a stored image."""
+    path = image_store.path(filename)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return FileResponse(path, media_type=media_type)
\ No newline at end of file
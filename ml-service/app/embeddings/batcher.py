@@ -0,0 +1,110 @@
+import numpy as np
+from typing import Callable, List, Optional
+import logging
+import asyncio
+
+logger = logging.getLogger(__name__)
+
+class EmbedBatcher:
+    def __init__(self,
+                 encode: Callable[[List[str]], np.ndarray],
+                 max_batch: int = 32,
+                 max_wait: float = 0.005):
+        """Collate concurrent embedding requests into single forward passes.
+
+        Args:
+            encode: Function embedding a list of texts into an (N, dim) array
+            max_batch: Maximum number of texts per forward pass
+            max_wait: Seconds to wait for more texts before running a batch
+        """
+        self.encode = encode
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background consumer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the consumer and cancel requests that are still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def submit(self, text: str) -> np.ndarray:
+        """Embed a single text as part of the next batch.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            numpy.ndarray of shape (1, dim)
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _run(self):
+        """Drain the queue into batched forward passes."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.max_wait
+
+                # Collect more texts until the batch is full or the window closes
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._encode_batch(batch)
+            except asyncio.CancelledError:
+                # Requests already taken off the queue are cancelled here;
+                # stop() cancels the ones still queued
+                for _, future in batch:
+                    future.cancel()
+                raise
+
+    async def _encode_batch(self, batch: List[tuple]):
+        """Embed a batch, retrying its texts one by one if it fails.
+
+        Args:
+            batch: List of (text, future) tuples
+        """
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = await asyncio.to_thread(self.encode, texts)
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(f"Error embedding text: {str(e)}", exc_info=True)
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            # One bad input should only fail its own request
+            logger.warning(f"Error embedding batch of {len(texts)} texts, retrying one by one: {str(e)}")
+            for item in batch:
+                await self._encode_batch([item])
+            return
+
+        for i, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(embeddings[i:i + 1])
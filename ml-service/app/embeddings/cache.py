@@ -0,0 +1,74 @@
+import numpy as np
+from collections import OrderedDict
+from typing import Callable, List, Optional
+import threading
+
+class EmbeddingCache:
+    def __init__(self, maxsize: int = 4096):
+        """Initialize an LRU cache of text embeddings.
+
+        Embeddings are deterministic for a given model and text, so repeated
+        queries (retries, autocomplete) can skip the forward pass entirely.
+
+        Args:
+            maxsize: Maximum number of cached embeddings
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Normalize text into a cache key.
+
+        The tokenizers in use are uncased and ignore surrounding whitespace.
+        """
+        return text.strip().lower()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached embedding for a key, if any."""
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, key: str, embedding: np.ndarray):
+        """Store an embedding, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def encode(self, texts: List[str], encode: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """Embed texts, running the model only on cache misses.
+
+        Args:
+            texts: List of texts to embed
+            encode: Function embedding a list of texts into an (N, dim) array
+
+        Returns:
+            numpy.ndarray of shape (len(texts), dim)
+        """
+        if not texts:
+            return encode(texts)
+
+        keys = [self.key(text) for text in texts]
+        rows = [self.get(key) for key in keys]
+
+        # Encode each distinct missing text once
+        missing = {}
+        for key, text, row in zip(keys, texts, rows):
+            if row is None and key not in missing:
+                missing[key] = text
+
+        if missing:
+            encoded = encode(list(missing.values()))
+            fresh = {}
+            for key, embedding in zip(missing, encoded):
+                fresh[key] = embedding.copy()
+                self.put(key, fresh[key])
+            rows = [fresh[key] if row is None else row for key, row in zip(keys, rows)]
+
+        return np.stack(rows)
@@ -1,5 +1,6 @@
 from transformers import CLIPProcessor, CLIPModel
 import torch
+import torch.nn.functional as F
 import numpy as np
 from PIL import Image
 import logging
@@ -7,61 +8,156 @@ import time
 import base64
 import io
 import magic
+import threading
+from typing import BinaryIO, List, Union
+from .cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
 class ImageModel:
-    def __init__(self, model_name: str = "openai/clip-vit-base-patch32"):
+    def __init__(self, model_name: str = "openai/clip-vit-base-patch32", cache_size: int = 4096):
         """Initialize the CLIP model for image processing.
         
         Args:
             model_name: The name of the CLIP model to use
+            cache_size: Number of text query embeddings to keep cached
         """
         logger.info(f"Loading CLIP model {model_name}")
         
         self.processor = CLIPProcessor.from_pretrained(model_name)
         self.model = CLIPModel.from_pretrained(model_name)
         
-        # Move to GPU if available
+        # Move to GPU if available, running in bfloat16 there
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.model.to(self.device)
-        logger.info(f"Using device: {self.device}")
+        self.dtype = torch.bfloat16 if self.device == "cuda" else torch.float32
+        self.model = self.model.to(self.device, dtype=self.dtype).eval()
+        logger.info(f"Using device: {self.device} ({self.dtype})")
+        
+        # The vision tower always sees fixed 224x224 inputs, so compile it once
+        # on GPU; the text tower keeps running eagerly since query lengths vary.
+        # CUDA graph modes are avoided: their state is per thread, and image
+        # embeddings are computed on the default thread pool
+        if self.device == "cuda":
+            self.model.vision_model = torch.compile(self.model.vision_model)
         
         # Get embedding dimension
         self.embedding_dim = self.model.config.projection_dim
         logger.info(f"Model embedding size: {self.embedding_dim} dimensions")
+        
+        # Reuse one libmagic cookie; it is not safe to share across threads
+        self._magic = magic.Magic(mime=True)
+        self._magic_lock = threading.Lock()
+        
+        self._text_cache = EmbeddingCache(cache_size)
+        
+        # CLIP preprocessing constants, applied with torch on the model device
+        image_processor = self.processor.image_processor
+        self.image_size = image_processor.size["shortest_edge"]
+        self.crop_size = (image_processor.crop_size["height"], image_processor.crop_size["width"])
+        mean = torch.tensor(image_processor.image_mean, device=self.device).view(1, 3, 1, 1)
+        std = torch.tensor(image_processor.image_std, device=self.device).view(1, 3, 1, 1)
+        # (x / 255 - mean) / std folded into a single multiply-subtract
+        self._pixel_scale = 1.0 / (255.0 * std)
+        self._pixel_shift = mean / std
+        
+        # Compile the vision tower now rather than on the first upload
+        if self.device == "cuda":
+            self._warmup()
 
-    def _validate_image(self, image_data: bytes) -> bool:
+    def _warmup(self):
+        """Run one forward pass on a blank image to trigger compilation."""
+        pixel_values = torch.zeros(1, 3, *self.crop_size, device=self.device)
+        with torch.inference_mode(), self._autocast():
+            self.model.get_image_features(pixel_values=pixel_values)
+        logger.info("Compiled CLIP vision model")
+
+    def _autocast(self):
+        """Autocast context matching the model dtype (a no-op on CPU)."""
+        return torch.autocast(self.device, dtype=self.dtype, enabled=self.device == "cuda")
+
+    def detect_mime_type(self, image_data: Union[bytes, BinaryIO]) -> str:
+        """Sniff the MIME type of image data from its file signature.
+        
+        Args:
+            image_data: Raw image bytes or a seekable file object
+            
+        Returns:
+            str: MIME type detected by libmagic
+        """
+        # The file signature lives in the first few KiB
+        if isinstance(image_data, bytes):
+            header = image_data[:4096]
+        else:
+            image_data.seek(0)
+            header = image_data.read(4096)
+            image_data.seek(0)
+        
+        with self._magic_lock:
+            return self._magic.from_buffer(header)
+
+    def _validate_image(self, image_data: Union[bytes, BinaryIO]) -> bool:
         """Validate image data format and type.
         
         Args:
-            image_data: Raw image bytes
+            image_data: Raw image bytes or a seekable file object
             
         Returns:
             bool: True if valid image, False otherwise
         """
-        mime = magic.from_buffer(image_data, mime=True)
-        return mime.startswith('image/')
+        return self.detect_mime_type(image_data).startswith('image/')
 
-    def _process_image(self, image_data: bytes) -> Image.Image:
+    def _process_image(self, image_data: Union[bytes, BinaryIO]) -> Image.Image:
         """Process raw image data into PIL Image.
         
         Args:
-            image_data: Raw image bytes
+            image_data: Raw image bytes or a seekable file object
             
         Returns:
             PIL.Image: Processed image
         """
-        image = Image.open(io.BytesIO(image_data))
-        if image.mode not in ['RGB', 'L']:
+        if isinstance(image_data, bytes):
+            image_data = io.BytesIO(image_data)
+        image = Image.open(image_data)
+        # JPEGs are decoded at the smallest DCT scale that still covers the
+        # model input size; other formats ignore the draft request
+        image.draft('RGB', (self.image_size, self.image_size))
+        if image.mode != 'RGB':
             image = image.convert('RGB')
         return image
 
-    def get_image_embedding(self, image_data: bytes, benchmark: bool = False) -> np.ndarray:
+    def _preprocess(self, image: Image.Image) -> torch.Tensor:
+        """Resize, center crop and normalize an image like CLIPImageProcessor.
+        
+        Args:
+            image: RGB PIL image
+            
+        Returns:
+            torch.Tensor: Pixel values of shape (1, 3, crop_height, crop_width)
+        """
+        pixels = torch.from_numpy(np.array(image)).to(self.device)
+        x = pixels.permute(2, 0, 1).unsqueeze(0).float()
+        
+        # Resize the shortest edge to the target size, keeping the aspect ratio
+        height, width = x.shape[-2:]
+        if height <= width:
+            size = (self.image_size, int(self.image_size * width / height))
+        else:
+            size = (int(self.image_size * height / width), self.image_size)
+        x = F.interpolate(x, size=size, mode="bicubic", align_corners=False, antialias=True)
+        x = x.clamp_(0, 255)
+        
+        crop_height, crop_width = self.crop_size
+        top = (size[0] - crop_height) // 2
+        left = (size[1] - crop_width) // 2
+        x = x[..., top:top + crop_height, left:left + crop_width]
+        
+        return x.mul_(self._pixel_scale).sub_(self._pixel_shift)
+
+    def get_image_embedding(self, image_data: Union[bytes, BinaryIO], benchmark: bool = False) -> np.ndarray:
         """Generate embedding for an image.
         
         Args:
-            image_data: Raw image bytes
+            image_data: Raw image bytes or a seekable file object
             benchmark: If True, return timing information
             
         Returns:
@@ -75,13 +171,14 @@ class ImageModel:
         
         image = self._process_image(image_data)
         
-        inputs = self.processor(images=image, return_tensors="pt").to(self.device)
+        pixel_values = self._preprocess(image)
         
-        with torch.no_grad():
-            image_features = self.model.get_image_features(**inputs)
+        with torch.inference_mode(), self._autocast():
+            image_features = self.model.get_image_features(pixel_values=pixel_values)
             
+        # Normalize on the device so numpy receives the final array
+        image_features = F.normalize(image_features.float(), dim=-1)
         embedding = image_features.cpu().numpy()
-        embedding = embedding / np.linalg.norm(embedding, axis=1, keepdims=True)
         
         if benchmark:
             time_taken = time.time() - start_time
@@ -90,11 +187,11 @@ class ImageModel:
         
         return embedding
 
-    def get_text_embedding(self, text: str, benchmark: bool = False) -> np.ndarray:
+    def get_text_embedding(self, text: Union[str, List[str]], benchmark: bool = False) -> np.ndarray:
         """Generate embedding for text query.
         
         Args:
-            text: Text to embed
+            text: Text or list of texts to embed
             benchmark: If True, return timing information
             
         Returns:
@@ -103,13 +200,8 @@ class ImageModel:
         """
         start_time = time.time() if benchmark else None
         
-        inputs = self.processor(text=text, return_tensors="pt", padding=True).to(self.device)
-        
-        with torch.no_grad():
-            text_features = self.model.get_text_features(**inputs)
-            
-        embedding = text_features.cpu().numpy()
-        embedding = embedding / np.linalg.norm(embedding, axis=1, keepdims=True)
+        texts = [text] if isinstance(text, str) else text
+        embedding = self._text_cache.encode(texts, self._encode_texts)
         
         if benchmark:
             time_taken = time.time() - start_time
@@ -118,6 +210,31 @@ class ImageModel:
         
         return embedding
 
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Run the CLIP text tower on a list of texts.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            numpy.ndarray of normalized embeddings
+        """
+        # Long queries are cut to the text tower's context length (77 tokens)
+        inputs = self.processor(
+            text=texts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=self.model.config.text_config.max_position_embeddings
+        ).to(self.device)
+        
+        with torch.inference_mode(), self._autocast():
+            text_features = self.model.get_text_features(**inputs)
+            
+        # Normalize on the device so numpy receives the final array
+        text_features = F.normalize(text_features.float(), dim=-1)
+        return text_features.cpu().numpy()
+
     def encode_image_base64(self, image_data: bytes) -> str:
         """Encode image data as base64 string.
         
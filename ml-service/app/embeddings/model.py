@@ -4,30 +4,52 @@ from typing import List, Union
 import torch
 import logging
 import time
+from .cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
 class EmbeddingModel:
-    def __init__(self, model_name: str = "sentence-transformers/all-mpnet-base-v2"):
+    def __init__(self,
+                 model_name: str = "sentence-transformers/all-mpnet-base-v2",
+                 cache_size: int = 4096,
+                 backend: str = "torch",
+                 onnx_file: str = "onnx/model_qint8_avx512_vnni.onnx"):
         """Initialize the embedding model.
         
         Args:
             model_name: Name of the sentence transformer model to use
                 Default: all-mpnet-base-v2
+            cache_size: Number of text embeddings to keep cached
+            backend: "torch", or "onnx" to run a quantized ONNX export on CPU
+            onnx_file: ONNX file in the model repo used by the onnx backend
+                Default: dynamic int8 export for AVX-512 VNNI CPUs
         """
-        logger.info(f"Loading model {model_name}")
+        logger.info(f"Loading model {model_name} ({backend} backend)")
         
-        # Load model directly
-        self.model = SentenceTransformer(model_name)
-        
-        # Move to GPU if available
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.model.to(self.device)
+        
+        if backend == "onnx":
+            # int8 ONNX Runtime session; only used on CPU
+            self.model = SentenceTransformer(
+                model_name,
+                backend="onnx",
+                device="cpu",
+                model_kwargs={"file_name": onnx_file}
+            )
+            self.device = "cpu"
+        elif backend == "torch":
+            # Load model directly, moving to GPU if available
+            self.model = SentenceTransformer(model_name)
+            self.model.to(self.device)
+        else:
+            raise ValueError(f"Unsupported backend: {backend}")
         logger.info(f"Using device: {self.device}")
         
         # Log model info
         embedding_size = self.model.get_sentence_embedding_dimension()
         logger.info(f"Model embedding size: {embedding_size} dimensions")
+        
+        self._cache = EmbeddingCache(cache_size)
 
     def get_embeddings(self, texts: Union[str, List[str]], benchmark: bool = False) -> Union[np.ndarray, tuple]:
         """Generate embeddings for the input text(s).
@@ -45,12 +67,8 @@ class EmbeddingModel:
         
         start_time = time.time() if benchmark else None
             
-        # Generate embeddings
-        embeddings = self.model.encode(
-            texts,
-            normalize_embeddings=True,  # Normalize
-            show_progress_bar=False
-        )
+        # Generate embeddings, reusing cached ones
+        embeddings = self._cache.encode(texts, self._encode)
         
         if benchmark:
             time_taken = time.time() - start_time
@@ -59,6 +77,14 @@ class EmbeddingModel:
         
         return embeddings
 
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Run the sentence transformer on a list of texts."""
+        return self.model.encode(
+            texts,
+            normalize_embeddings=True,  # Normalize
+            show_progress_bar=False
+        )
+
     def similarity_score(self, text1: str, text2: str, benchmark: bool = False) -> Union[float, tuple]:
         """Calculate similarity score between two texts.
         
@@ -73,11 +99,11 @@ class EmbeddingModel:
         """
         start_time = time.time() if benchmark else None
         
-        # Since we normalize, we can just use dot product
-        emb1 = self.get_embeddings(text1)
-        emb2 = self.get_embeddings(text2)
+        # Embed both texts in one forward pass; since we normalize,
+        # the dot product of the two rows is the cosine similarity
+        embeddings = self.get_embeddings([text1, text2])
         
-        similarity = float(np.dot(emb1, emb2.T))
+        similarity = float(np.dot(embeddings[0], embeddings[1]))
         
         if benchmark:
             time_taken = time.time() - start_time
@@ -0,0 +1,86 @@
+from typing import BinaryIO, Optional, Union
+from pathlib import Path
+import mimetypes
+import logging
+import uuid
+import shutil
+import os
+
+logger = logging.getLogger(__name__)
+
+class ImageStore:
+    def __init__(self, root: str = "/data/images"):
+        """Initialize the filesystem store for uploaded images.
+
+        Args:
+            root: Directory the image files are written to
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Storing images in {self.root}")
+
+    def save(self,
+             image_id: str,
+             image_data: Union[bytes, BinaryIO],
+             content_type: Optional[str] = None) -> str:
+        """Write image bytes to the store.
+
+        Args:
+            image_id: UUID of the image point
+            image_data: Raw image bytes or a seekable file object
+            content_type: Sniffed MIME type of the image, used for the file extension
+
+        Returns:
+            str: File name of the stored image
+        """
+        extension = ""
+        if content_type and content_type.startswith("image/"):
+            extension = mimetypes.guess_extension(content_type) or ""
+        filename = f"{uuid.UUID(image_id)}{extension}"
+
+        # Write to a temporary name first so readers never see partial files
+        path = self.root / filename
+        tmp_path = path.with_name(f".{filename}.tmp")
+        try:
+            if isinstance(image_data, bytes):
+                tmp_path.write_bytes(image_data)
+            else:
+                image_data.seek(0)
+                with open(tmp_path, "wb") as f:
+                    shutil.copyfileobj(image_data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return filename
+
+    def path(self, filename: str) -> Optional[Path]:
+        """Resolve a stored file name to its path.
+
+        Args:
+            filename: File name returned by save()
+
+        Returns:
+            Path to the file, or None if the name is invalid or missing
+        """
+        stem, _, extension = filename.partition(".")
+        try:
+            if str(uuid.UUID(stem)) != stem:
+                return None
+        except ValueError:
+            return None
+        if extension and not extension.isalnum():
+            return None
+
+        path = self.root / filename
+        return path if path.is_file() else None
+
+    def delete(self, filename: str):
+        """Remove a stored image if it exists.
+
+        Args:
+            filename: File name returned by save()
+        """
+        path = self.path(filename)
+        if path is not None:
+            path.unlink(missing_ok=True)
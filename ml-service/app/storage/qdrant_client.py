@@ -1,108 +1,265 @@
 from typing import List, Dict, Any, Optional
 import httpx
 import numpy as np
+import orjson
+import hashlib
+import heapq
+import operator
+import os
+from cachetools import TTLCache
 import logging
-import json
-from pydantic import BaseModel
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Queued by aclose() to make the flusher send its current batch and exit
+_STOP_FLUSHER = object()
+
+# Upserts are sent with wait=false, so Qdrant may still be applying a write
+# for a short while after acknowledging it; searches started within this
+# many seconds of a write are not cached
+_WRITE_SETTLE_SECONDS = 1.0
+
+# Below this size Qdrant's planner searches collections best on its own
+_SMALL_COLLECTION_POINTS = 10_000
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a request body, writing numpy arrays directly from their buffers."""
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _prepare_vec(embedding: np.ndarray) -> np.ndarray:
+    """Return the embedding as a flat, contiguous float32 array.
+    
+    Qdrant stores float32 anyway, and float32 values serialize to shorter
+    JSON numbers than float64. No copy is made when the input already fits.
+    """
+    return np.ascontiguousarray(embedding, dtype=np.float32).ravel()
+
+def _quantize_vec(vectors: np.ndarray) -> np.ndarray:
+    """Scale vectors to int8 row by row for a shorter request body.
+    
+    The scale is dropped: collections use Cosine distance, which Qdrant
+    normalizes on insert, so only the direction of each vector matters.
+    """
+    scale = np.max(np.abs(vectors), axis=-1, keepdims=True) / 127.0
+    scale[scale == 0] = 1.0
+    return np.round(vectors / scale).astype(np.int8)
+
 class QdrantClient:
-    def __init__(self, host: str = "qdrant", port: int = 6333):
+    def __init__(self,
+                 host: str = "qdrant",
+                 port: int = 6333,
+                 batch_size: int = 64,
+                 flush_interval: float = 0.02):
         """Initialize Qdrant client.
         
         Args:
             host: Qdrant host
             port: Qdrant port
+            batch_size: Maximum number of points sent in one upsert
+            flush_interval: Seconds to wait for more points before flushing
         """
         self.base_url = f"http://{host}:{port}"
+        
+        # Binary quantization (32x smaller) suits the text embeddings; CLIP
+        # vectors keep int8 scalar quantization (4x smaller). Both stay in RAM
+        # and searches oversample the quantized candidates before rescoring;
+        # the binary-quantized index needs a wider HNSW beam to keep recall.
         self.collections = {
-            "documents": {"dim": 768},  # MPNet embeddings
-            "images": {"dim": 512}      # CLIP embeddings
+            "documents": {  # MPNet embeddings
+                "dim": 768,
+                "distance": "Cosine",
+                "quantization": {
+                    "binary": {"always_ram": True}
+                },
+                "oversampling": 3.0,
+                "hnsw_ef": 256
+            },
+            "images": {  # CLIP embeddings
+                "dim": 512,
+                "distance": "Cosine",
+                "quantization": {
+                    "scalar": {
+                        "type": "int8",
+                        "quantile": 0.99,
+                        "always_ram": True
+                    }
+                },
+                "oversampling": 2.0,
+                "hnsw_ef": 128
+            }
         }
         
-        # Initialize collections asynchronously
-        self._collections_initialized = False
+        # Approximate point counts, used to pick search params per collection
+        self._points_count: Dict[str, int] = {}
+        
+        # Short-lived search results; a collection's generation is bumped on
+        # every acknowledged write so older results are no longer looked up,
+        # and results are only cached once recent writes have had time to apply
+        self._search_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+        self._generations: Dict[str, int] = {}
+        self._last_write: Dict[str, float] = {}
+        
+        # Bound fan-out searches so they share the keep-alive pool fairly
+        self._max_concurrent_searches = max(3, 2 * (os.cpu_count() or 1) + 1)
+        self._search_semaphore = asyncio.Semaphore(self._max_concurrent_searches)
+        
+        # Shared HTTP client, created in connect()
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Pending upserts, coalesced into batches by the flusher task
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._flusher_task: Optional[asyncio.Task] = None
+        
+        # Initialize collections asynchronously, exactly once
+        self._ready = asyncio.Event()
+        self._init_lock = asyncio.Lock()
+        
+    async def connect(self):
+        """Create the pooled HTTP client used for all Qdrant requests."""
+        if self._client is None:
+            # Size the pool so concurrent searches and upserts all keep
+            # their connections alive instead of queueing for one
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+                timeout=60
+            )
+    
+    async def aclose(self):
+        """Flush pending upserts and close the pooled HTTP client."""
+        self._ready.clear()
+        if self._flusher_task is not None:
+            # Stop the flusher cleanly so it sends the points it has collected
+            if not self._flusher_task.done():
+                await self._pending.put(_STOP_FLUSHER)
+                await self._flusher_task
+            self._flusher_task = None
+        
+        # Send whatever is still queued before the client goes away
+        batch = []
+        while not self._pending.empty():
+            batch.append(self._pending.get_nowait())
+        if batch:
+            await self._flush(batch)
+        
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     async def ensure_collections(self):
-        """Ensure collections are initialized."""
-        if not self._collections_initialized:
-            await self._init_collections()
-            self._collections_initialized = True
+        """Ensure collections are initialized and the flusher is running."""
+        if self._ready.is_set():
+            return
+        
+        async with self._init_lock:
+            if not self._ready.is_set():
+                await self._init_collections()
+                if self._flusher_task is None:
+                    self._flusher_task = asyncio.create_task(self._flusher())
+                self._ready.set()
 
     async def _init_collections(self):
         """Initialize collections if they don't exist."""
-        for name, config in self.collections.items():
-            try:
-                async with httpx.AsyncClient() as client:
-                    # Check if collection exists
-                    response = await client.get(f"{self.base_url}/collections/{name}")
-                    
-                    if response.status_code == 404:
-                        # Create collection
-                        create_data = {
-                            "name": name,
-                            "vectors": {
-                                "size": config["dim"],
-                                "distance": "Cosine"
-                            }
-                        }
-                        
-                        response = await client.put(
-                            f"{self.base_url}/collections/{name}",
-                            json=create_data
-                        )
-                        
-                        if response.status_code == 200:
-                            logger.info(f"Created collection: {name}")
-                        else:
-                            error_msg = f"Failed to create collection {name}: {response.text}"
-                            logger.error(error_msg)
-                            raise Exception(error_msg)
-                    elif response.status_code != 200:
-                        error_msg = f"Failed to check collection {name}: {response.text}"
-                        logger.error(error_msg)
-                        raise Exception(error_msg)
-                    else:
-                        logger.info(f"Collection {name} already exists")
-                        
-            except Exception as e:
-                logger.error(f"Error initializing collection {name}: {str(e)}")
-                self._collections_initialized = False
-                raise
+        await self.connect()
+        # Collections are independent, so check (and create) them concurrently
+        await asyncio.gather(*[
+            self._ensure_collection(name, config)
+            for name, config in self.collections.items()
+        ])
+
+    async def _ensure_collection(self, name: str, config: Dict[str, Any]):
+        """Create a single collection if it doesn't exist.
+        
+        Args:
+            name: Collection name
+            config: Collection config from self.collections
+        """
+        try:
+            # Check if collection exists
+            response = await self._client.get(f"/collections/{name}")
+            
+            if response.status_code == 404:
+                # Create collection
+                create_data = {
+                    "name": name,
+                    "vectors": {
+                        "size": config["dim"],
+                        "distance": config["distance"]
+                    },
+                    "hnsw_config": {
+                        "m": 16,
+                        "ef_construct": 128
+                    },
+                    "quantization_config": config["quantization"]
+                }
                 
-        self._collections_initialized = True
-    
+                response = await self._client.put(
+                    f"/collections/{name}",
+                    content=_dumps(create_data),
+                    headers=_JSON_HEADERS
+                )
+                
+                if response.status_code == 200:
+                    logger.info("Created collection: %s", name)
+                    self._points_count[name] = 0
+                else:
+                    error_msg = f"Failed to create collection {name}: {response.text}"
+                    logger.error(error_msg)
+                    raise Exception(error_msg)
+            elif response.status_code != 200:
+                error_msg = f"Failed to check collection {name}: {response.text}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
+            else:
+                logger.info("Collection %s already exists", name)
+                self._points_count[name] = orjson.loads(response.content)["result"].get("points_count") or 0
+                
+        except Exception as e:
+            logger.error("Error initializing collection %s: %s", name, e)
+            raise
+
     async def add_document(self,
                           document_id: str,
                           embedding: np.ndarray,
                           text: str = None,
                           collection_name: str = "documents",
-                          payload: Dict[str, Any] = None) -> bool:
+                          payload: Dict[str, Any] = None,
+                          emit_stats: bool = False,
+                          quantize: bool = False) -> bool:
         """Add a document to the vector store.
         
+        The point is queued and upserted together with other pending points
+        by the background flusher.
+        
         Args:
             document_id: Unique identifier for the document
             embedding: Document embedding vector
             text: Document text (for text documents)
             collection_name: Name of the collection to add to
             payload: Additional payload data
+            emit_stats: If True, log vector statistics at debug level
+            quantize: If True, send the vector as int8 values to cut transport size
             
         Returns:
             bool: Success status
         """
-        await self.ensure_collections()
+        if not self._ready.is_set():
+            await self.ensure_collections()
         try:
-            logger.info(f"Vector details for {collection_name}:")
-            logger.info(f"Shape: {embedding.shape}")
-            logger.info(f"Type: {embedding.dtype}")
-            logger.info(f"Sample (first 5): {embedding[:5]}")
-            logger.info(f"Min: {np.min(embedding)}, Max: {np.max(embedding)}")
-            logger.info(f"Norm: {np.linalg.norm(embedding)}")
+            # Vector statistics are O(dim), only compute them when asked to
+            if emit_stats and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Vector details for %s: shape=%s, dtype=%s, min=%s, max=%s, norm=%s",
+                    collection_name, embedding.shape, embedding.dtype,
+                    np.min(embedding), np.max(embedding), np.linalg.norm(embedding)
+                )
 
-            # Convert numpy array to list and ensure it's flat
-            vector = embedding.flatten().tolist()
+            vector = self._transport_vec(collection_name, _prepare_vec(embedding), quantize)
 
             # Prepare payload
             if payload is None:
@@ -111,40 +268,189 @@ class QdrantClient:
             if text is not None:
                 payload["text"] = text
 
-            # Prepare request data
-            point_data = {
-                "points": [
-                    {
-                        "id": document_id,
-                        "vector": vector,
-                        "payload": payload
-                    }
-                ]
+            point = {
+                "id": document_id,
+                "vector": vector,
+                "payload": payload
             }
 
-            url = f"{self.base_url}/collections/{collection_name}/points"
-            logger.info(f"Making request to: {url}")
-            logger.info(f"Request body size: {len(str(point_data))} bytes")
-
-            async with httpx.AsyncClient() as client:
-                response = await client.put(
-                    url,
-                    json=point_data
+            # Queue the point and wait for the flusher to report its batch status
+            future = asyncio.get_running_loop().create_future()
+            await self._pending.put((collection_name, point, future))
+            return await future
+        except Exception as e:
+            logger.error("Error adding document to %s: %s", collection_name, e, exc_info=True)
+            return False
+            
+    async def add_documents(self,
+                            document_ids: List[str],
+                            embeddings: np.ndarray,
+                            texts: Optional[List[str]] = None,
+                            collection_name: str = "documents",
+                            payloads: Optional[List[Dict[str, Any]]] = None,
+                            quantize: bool = False) -> bool:
+        """Add many documents to the vector store in a single request.
+        
+        Unlike add_document, the points bypass the flusher queue and are sent
+        immediately, which suits bulk ingest and re-indexing.
+        
+        Args:
+            document_ids: Unique identifiers for the documents
+            embeddings: Document embedding vectors of shape (N, dim)
+            texts: Document texts (for text documents)
+            collection_name: Name of the collection to add to
+            payloads: Additional payload data per document
+            quantize: If True, send the vectors as int8 values to cut transport size
+            
+        Returns:
+            bool: Success status
+        """
+        if not document_ids:
+            return True
+        if not self._ready.is_set():
+            await self.ensure_collections()
+        try:
+            # Reject mismatched inputs instead of silently regrouping the matrix
+            count = len(document_ids)
+            if np.ndim(embeddings) != 2 or len(embeddings) != count:
+                raise ValueError(
+                    f"Expected embeddings of shape ({count}, dim), got {np.shape(embeddings)}"
                 )
+            if texts is not None and len(texts) != count:
+                raise ValueError(f"Expected {count} texts, got {len(texts)}")
+            if payloads is not None and len(payloads) != count:
+                raise ValueError(f"Expected {count} payloads, got {len(payloads)}")
+            
+            # One conversion for the whole matrix; rows are contiguous views
+            vectors = _prepare_vec(embeddings).reshape(count, -1)
+            vectors = self._transport_vec(collection_name, vectors, quantize)
 
-            logger.info(f"Response status: {response.status_code}")
-            logger.info(f"Response body: {response.text}")
+            points = []
+            for i, document_id in enumerate(document_ids):
+                payload = dict(payloads[i]) if payloads is not None else {}
+                if texts is not None:
+                    payload["text"] = texts[i]
+                points.append({
+                    "id": document_id,
+                    "vector": vectors[i],
+                    "payload": payload
+                })
 
-            return response.status_code == 200
+            return await self._upsert(collection_name, points)
         except Exception as e:
-            logger.error(f"Error adding document to {collection_name}: {str(e)}", exc_info=True)
+            logger.error("Error adding documents to %s: %s", collection_name, e, exc_info=True)
+            return False
+            
+    def _transport_vec(self, collection_name: str, vectors: np.ndarray, quantize: bool) -> np.ndarray:
+        """Return prepared vectors as sent to Qdrant, quantized if requested.
+        
+        Args:
+            collection_name: Name of the target collection
+            vectors: Prepared float32 vector or (N, dim) matrix
+            quantize: Whether to quantize to int8
+            
+        Returns:
+            numpy.ndarray of float32 or int8 values
+        """
+        if not quantize:
+            return vectors
+        if self.collections[collection_name]["distance"] != "Cosine":
+            raise ValueError(f"Collection {collection_name} does not accept unscaled int8 vectors")
+        return _quantize_vec(vectors)
+
+    async def _flusher(self):
+        """Drain the pending queue into batched upserts until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                item = await self._pending.get()
+                if item is _STOP_FLUSHER:
+                    return
+                batch.append(item)
+                deadline = loop.time() + self.flush_interval
+                
+                # Collect more points until the batch is full or the window closes
+                while len(batch) < self.batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._pending.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is _STOP_FLUSHER:
+                        stopping = True
+                        break
+                    batch.append(item)
+                
+                await self._flush(batch)
+            except asyncio.CancelledError:
+                # Never leave a caller waiting on a point that was not sent
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result(False)
+                raise
+
+    async def _flush(self, batch: List[tuple]):
+        """Upsert a batch of queued points, one request per collection.
+        
+        Args:
+            batch: List of (collection_name, point, future) tuples
+        """
+        by_collection: Dict[str, List[tuple]] = {}
+        for collection_name, point, future in batch:
+            by_collection.setdefault(collection_name, []).append((point, future))
+        
+        for collection_name, items in by_collection.items():
+            success = await self._upsert(collection_name, [point for point, _ in items])
+            for _, future in items:
+                if not future.done():
+                    future.set_result(success)
+
+    async def _upsert(self, collection_name: str, points: List[Dict[str, Any]]) -> bool:
+        """Send points to a collection in a single request.
+        
+        Args:
+            collection_name: Name of the collection to add to
+            points: Qdrant point structs
+            
+        Returns:
+            bool: Success status
+        """
+        try:
+            body = _dumps({"points": points})
+
+            response = await self._client.put(
+                f"/collections/{collection_name}/points",
+                params={"wait": "false"},
+                content=body,
+                headers=_JSON_HEADERS
+            )
+
+            if response.status_code != 200:
+                logger.error("Failed to upsert %d points to %s: %s", len(points), collection_name, response.text)
+                return False
+            
+            # Overwrites are counted too; the count only needs to be approximate
+            self._points_count[collection_name] = self._points_count.get(collection_name, 0) + len(points)
+            self._generations[collection_name] = self._generations.get(collection_name, 0) + 1
+            self._last_write[collection_name] = asyncio.get_running_loop().time()
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Upserted %d points to %s (%d bytes)", len(points), collection_name, len(body))
+            return True
+        except Exception as e:
+            logger.error("Error upserting points to %s: %s", collection_name, e, exc_info=True)
             return False
             
     async def search_documents(self,
                              query_embedding: np.ndarray,
                              collection_name: str = "documents",
                              limit: int = 10,
-                             score_threshold: float = 0.7) -> List[Dict[str, Any]]:
+                             score_threshold: float = 0.7,
+                             hnsw_ef: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search for similar documents.
         
         Args:
@@ -152,50 +458,95 @@ class QdrantClient:
             collection_name: Name of the collection to search
             limit: Maximum number of results
             score_threshold: Minimum similarity score
+            hnsw_ef: HNSW beam size, defaults to the collection's setting
             
         Returns:
-            List of documents with scores
+            List of documents with scores; each call returns its own result dicts
         """
-        await self.ensure_collections()
+        if not self._ready.is_set():
+            await self.ensure_collections()
         try:
-            # Convert numpy array to list and ensure it's flat
-            vector = query_embedding.flatten().tolist()
-
+            started = asyncio.get_running_loop().time()
+            
+            # Convert once for both the cache key and the request body
+            vector = _prepare_vec(query_embedding)
+            
+            # The cache is only touched from the event loop, so it needs no lock;
+            # the contiguous vector is hashed through the buffer protocol
+            cache_key = (
+                collection_name,
+                self._generations.get(collection_name, 0),
+                hashlib.blake2b(vector, digest_size=16).digest(),
+                limit,
+                score_threshold,
+                hnsw_ef
+            )
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                return [dict(result) for result in cached]
+            
             # Prepare request data
-            search_data = {
-                "vector": vector,
-                "limit": limit,
-                "params": {
-                    "hnsw_ef": 128,
-                    "exact": False
-                },
-                "score_threshold": score_threshold,
-                "with_payload": True,
-                "with_vector": False
-            }
-
-            url = f"{self.base_url}/collections/{collection_name}/points/search"
-            logger.info(f"Making search request to: {url}")
-            logger.info(f"Search request body: {search_data}")
-
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=search_data
-                )
+            search_data = self._search_request(vector, collection_name, limit, score_threshold, hnsw_ef)
 
-            logger.info(f"Search response status: {response.status_code}")
-            logger.info(f"Search response body: {response.text}")
+            response = await self._client.post(
+                f"/collections/{collection_name}/points/search",
+                content=_dumps(search_data),
+                headers=_JSON_HEADERS
+            )
 
             if response.status_code != 200:
+                logger.error("Search in %s failed: %s", collection_name, response.text)
                 return []
 
-            results = response.json()
-            return results["result"]
+            results = orjson.loads(response.content)["result"]
+            
+            # A write acknowledged just before this search may not be visible
+            # in its results yet, so only cache once the collection has settled
+            last_write = self._last_write.get(collection_name)
+            if last_write is None or started - last_write >= _WRITE_SETTLE_SECONDS:
+                self._search_cache[cache_key] = results
+                return [dict(result) for result in results]
+            return results
         except Exception as e:
-            logger.error(f"Error searching documents in {collection_name}: {str(e)}", exc_info=True)
+            logger.error("Error searching documents in %s: %s", collection_name, e, exc_info=True)
             return []
 
+    def _search_request(self,
+                        query_embedding: np.ndarray,
+                        collection_name: str,
+                        limit: int,
+                        score_threshold: float,
+                        hnsw_ef: Optional[int] = None) -> Dict[str, Any]:
+        """Build the body of a single search request.
+        
+        The embedding is passed through _prepare_vec, which is free for
+        vectors that were already prepared.
+        """
+        config = self.collections[collection_name]
+        params = {
+            # Rescore the oversampled quantized candidates with the original vectors
+            "quantization": {
+                "rescore": True,
+                "oversampling": config["oversampling"]
+            }
+        }
+        
+        # Small collections are left to Qdrant's planner, which falls back
+        # to a full scan below its threshold
+        if hnsw_ef is not None:
+            params["hnsw_ef"] = hnsw_ef
+        elif self._points_count.get(collection_name, 0) >= _SMALL_COLLECTION_POINTS:
+            params["hnsw_ef"] = config["hnsw_ef"]
+        
+        return {
+            "vector": _prepare_vec(query_embedding),
+            "limit": limit,
+            "params": params,
+            "score_threshold": score_threshold,
+            "with_payload": True,
+            "with_vector": False
+        }
+
     async def search_multiple_collections(self,
                                        embeddings: Dict[str, np.ndarray],
                                        limit: int = 10,
@@ -210,38 +561,42 @@ class QdrantClient:
         Returns:
             Combined and sorted list of results from all collections
         """
-        await self.ensure_collections()
+        if not self._ready.is_set():
+            await self.ensure_collections()
         try:
+            async def search(collection_name: str, embedding: np.ndarray) -> List[Dict[str, Any]]:
+                async with self._search_semaphore:
+                    return await self.search_documents(
+                        query_embedding=embedding,
+                        collection_name=collection_name,
+                        limit=limit,
+                        score_threshold=score_threshold
+                    )
+            
             # Search each collection in parallel
-            tasks = []
-            for collection_name, embedding in embeddings.items():
-                task = self.search_documents(
-                    query_embedding=embedding,
-                    collection_name=collection_name,
-                    limit=limit,
-                    score_threshold=score_threshold
-                )
-                tasks.append(task)
+            tasks = [search(collection_name, embedding) for collection_name, embedding in embeddings.items()]
             
-            # Wait for all searches to complete
-            results = await asyncio.gather(*tasks)
+            # Wait for all searches to complete; a failing collection is skipped
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Combine and process results
-            combined_results = []
+            searched = []
             for collection_name, collection_results in zip(embeddings.keys(), results):
-                for result in collection_results:
-                    # Add source collection to each result
-                    result["source_type"] = "text" if collection_name == "documents" else "image"
-                    combined_results.append(result)
-            
-            # Sort by score in descending order
-            combined_results.sort(key=lambda x: x["score"], reverse=True)
-            
-            # Limit total results if needed
-            if len(combined_results) > limit * 2:  # Allow more results for mixed content
-                combined_results = combined_results[:limit * 2]
+                if isinstance(collection_results, Exception):
+                    logger.error("Search in %s failed: %s", collection_name, collection_results)
+                    continue
+                source_type = "text" if collection_name == "documents" else "image"
+                searched.append((source_type, collection_results))
+
+            # Tag each result with its source collection in one pass
+            combined_results = [
+                {**result, "source_type": source_type}
+                for source_type, collection_results in searched
+                for result in collection_results
+            ]
             
-            return combined_results
+            # Keep the best results by score, in descending order;
+            # allow more results for mixed content
+            return heapq.nlargest(limit * 2, combined_results, key=operator.itemgetter("score"))
         except Exception as e:
-            logger.error(f"Error searching multiple collections: {str(e)}", exc_info=True)
+            logger.error("Error searching multiple collections: %s", e, exc_info=True)
             return [] 
\ No newline at end of file
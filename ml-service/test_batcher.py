@@ -0,0 +1,68 @@
+"""Embedding batcher tests, run against a fake encoder (no model needed)."""
+import asyncio
+import numpy as np
+import pytest
+from app.embeddings.batcher import EmbedBatcher
+
+class TestEmbedBatcher:
+    @pytest.fixture(autouse=True)
+    def _use_calls(self):
+        self.calls = []
+
+    def _encode(self, texts):
+        """Fake encoder recording each batch; row i holds the number in texts[i]"""
+        self.calls.append(list(texts))
+        if "bad" in texts:
+            raise ValueError("bad input")
+        return np.array([[float(text), 1.0] for text in texts], dtype=np.float32)
+
+    def test_concurrent_submits_are_batched(self):
+        """Test that concurrent requests share forward passes of at most max_batch texts"""
+        async def run():
+            batcher = EmbedBatcher(self._encode, max_batch=32, max_wait=0.05)
+            batcher.start()
+            try:
+                return await asyncio.gather(*[batcher.submit(str(i)) for i in range(40)])
+            finally:
+                await batcher.stop()
+
+        results = asyncio.run(run())
+        sizes = [len(batch) for batch in self.calls]
+        assert sum(sizes) == 40, "Every text should be encoded exactly once"
+        assert max(sizes) <= 32, "Batches should not exceed max_batch"
+        assert len(sizes) < 40, "Concurrent texts should share forward passes"
+        for i, embedding in enumerate(results):
+            assert embedding.shape == (1, 2), "Each caller should get a (1, dim) row"
+            assert embedding[0, 0] == i, "Each caller should get the row for its own text"
+
+    def test_failing_text_only_fails_its_caller(self):
+        """Test that one bad input in a batch does not fail the others"""
+        async def run():
+            batcher = EmbedBatcher(self._encode, max_wait=0.05)
+            batcher.start()
+            try:
+                return await asyncio.gather(
+                    batcher.submit("1"), batcher.submit("bad"), batcher.submit("3"),
+                    return_exceptions=True
+                )
+            finally:
+                await batcher.stop()
+
+        ok, bad, fine = asyncio.run(run())
+        assert isinstance(bad, ValueError), "The failing text should get the encoder error"
+        assert ok[0, 0] == 1 and fine[0, 0] == 3, "Other texts in the batch should still be embedded"
+
+    def test_stop_cancels_requests_in_collection_window(self):
+        """Test that stop() during the batching window cancels collected requests"""
+        async def run():
+            batcher = EmbedBatcher(self._encode, max_wait=10)
+            batcher.start()
+            request = asyncio.create_task(batcher.submit("1"))
+            await asyncio.sleep(0.05)
+            await batcher.stop()
+            await asyncio.wait_for(asyncio.wait([request]), 1)
+            return request
+
+        request = asyncio.run(run())
+        assert request.cancelled(), "Pending requests should be cancelled on stop()"
+        assert self.calls == [], "Nothing should be encoded after stop()"
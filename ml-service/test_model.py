@@ -1,9 +1,25 @@
+"""Embedding model tests.
+
+Run from ml-service with pytest; pytest.ini spreads the independent tests
+across pytest-xdist workers:
+
+    pip install -r requirements-test.txt
+    pytest
+"""
 import numpy as np
+import pytest
+from app.embeddings.cache import EmbeddingCache
 from app.embeddings.model import EmbeddingModel
 
+@pytest.fixture(scope="session")
+def model():
+    """Load the embedding model once per test session (per xdist worker)."""
+    return EmbeddingModel()
+
 class TestEmbeddingModel:
-    def __init__(self):
-        self.model = EmbeddingModel()
+    @pytest.fixture(autouse=True)
+    def _use_model(self, model):
+        self.model = model
 
     def test_single_text_embedding(self):
         """Test that single text embedding returns correct shape and type"""
@@ -58,33 +74,38 @@ class TestEmbeddingModel:
         embedding, _ = self.model.get_embeddings(long_text, benchmark=True)
         assert embedding.shape == (1, 384), "Long text should produce standard embedding shape"
 
-def run_tests():
-    """Run all tests and report results"""
-    test_instance = TestEmbeddingModel()
-    test_methods = [method for method in dir(test_instance) if method.startswith('test_')]
-    passed = 0
-    failed = 0
-    
-    print("\nRunning ML Service Tests...")
-    print("-" * 50)
-    
-    for method in test_methods:
-        try:
-            print(f"Running {method}...", end=" ")
-            getattr(test_instance, method)()
-            print("✓ PASSED")
-            passed += 1
-        except AssertionError as e:
-            print(f"✗ FAILED: {str(e)}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ ERROR: {str(e)}")
-            failed += 1
-    
-    print("-" * 50)
-    print(f"Results: {passed} passed, {failed} failed")
-    return failed == 0
+class TestEmbeddingCache:
+    @pytest.fixture(autouse=True)
+    def _use_cache(self):
+        self.cache = EmbeddingCache(maxsize=8)
+        self.calls = []
+
+    def _encode(self, texts):
+        """Fake encoder recording each call; rows depend only on the text length"""
+        self.calls.append(list(texts))
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+    def test_key_normalization(self):
+        """Test that case and surrounding whitespace share one cache entry"""
+        first = self.cache.encode(["Foo "], self._encode)
+        second = self.cache.encode(["foo"], self._encode)
+        assert len(self.calls) == 1, "Normalized texts should be encoded once"
+        assert np.array_equal(first, second), "Normalized texts should map to the same row"
+
+    def test_duplicate_texts_encoded_once(self):
+        """Test that repeated texts in one call run through the encoder once"""
+        embeddings = self.cache.encode(["a", "bb", "a"], self._encode)
+        assert self.calls == [["a", "bb"]], "Each distinct text should be encoded once"
+        assert embeddings.shape == (3, 2), "Every input text should get a row"
+        assert np.array_equal(embeddings[0], embeddings[2]), "Duplicate texts should get the same row"
 
-if __name__ == "__main__":
-    success = run_tests()
-    exit(0 if success else 1) 
\ No newline at end of file
+    def test_cache_hit_returns_copy(self):
+        """Test that cache hits return equal arrays the caller cannot alias"""
+        first = self.cache.encode(["text"], self._encode)
+        second = self.cache.encode(["text"], self._encode)
+        assert len(self.calls) == 1, "A cache hit should not run the encoder"
+        assert np.array_equal(first, second), "A cache hit should return the same values"
+        assert second is not first, "A cache hit should return a new array"
+        second[0, 0] = -1.0
+        assert np.array_equal(self.cache.encode(["text"], self._encode), first), \
+            "Modifying a returned array should not change the cache"
@@ -0,0 +1,161 @@
+"""QdrantClient tests, run against a mocked Qdrant REST API (no server needed)."""
+import asyncio
+import httpx
+import numpy as np
+import orjson
+import pytest
+import uuid
+from app.storage import qdrant_client
+from app.storage.qdrant_client import QdrantClient
+
+DIMS = {"documents": 768, "images": 512}
+
+class FakeQdrant:
+    def __init__(self):
+        """Record requests and answer them like a Qdrant server with existing collections."""
+        self.requests = []
+        self.failing_collections = set()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        collection = request.url.path.split("/")[2]
+        if request.method == "GET":
+            return httpx.Response(200, json={"result": {"points_count": 0}})
+        if collection in self.failing_collections:
+            return httpx.Response(500, text="unavailable")
+        if request.method == "PUT":
+            return httpx.Response(200, json={"result": {"status": "acknowledged"}})
+        return httpx.Response(200, json={"result": [{"id": 1, "score": 0.9, "payload": {"text": "hit"}}]})
+
+    def upserts(self):
+        return [r for r in self.requests if r.method == "PUT"]
+
+    def searches(self):
+        return [r for r in self.requests if r.method == "POST"]
+
+async def _connect(fake: FakeQdrant, **kwargs) -> QdrantClient:
+    qdrant = QdrantClient(**kwargs)
+    qdrant._client = httpx.AsyncClient(base_url=qdrant.base_url, transport=httpx.MockTransport(fake.handler))
+    await qdrant.ensure_collections()
+    return qdrant
+
+def _add(qdrant: QdrantClient, collection_name: str):
+    return asyncio.create_task(qdrant.add_document(
+        str(uuid.uuid4()), np.ones(DIMS[collection_name]), collection_name=collection_name
+    ))
+
+class TestUpsertFlusher:
+    @pytest.fixture(autouse=True)
+    def _use_fake(self):
+        self.fake = FakeQdrant()
+
+    def test_concurrent_adds_coalesce_per_collection(self):
+        """Test that concurrent adds are sent as one wait=false upsert per collection"""
+        async def run():
+            qdrant = await _connect(self.fake)
+            tasks = [_add(qdrant, "documents") for _ in range(3)] + [_add(qdrant, "images") for _ in range(2)]
+            results = await asyncio.gather(*tasks)
+            await qdrant.aclose()
+            return results
+
+        results = asyncio.run(run())
+        assert all(results), "Every add should succeed"
+        upserts = self.fake.upserts()
+        assert len(upserts) == 2, "Points should be coalesced into one upsert per collection"
+        for request in upserts:
+            assert request.url.params["wait"] == "false", "Upserts should not wait for indexing"
+        counts = {r.url.path.split("/")[2]: len(orjson.loads(r.content)["points"]) for r in upserts}
+        assert counts == {"documents": 3, "images": 2}, "Each upsert should carry its collection's points"
+
+    def test_callers_get_their_batch_status(self):
+        """Test that each caller gets the status of the upsert its point was sent in"""
+        self.fake.failing_collections.add("images")
+
+        async def run():
+            qdrant = await _connect(self.fake)
+            results = await asyncio.gather(_add(qdrant, "documents"), _add(qdrant, "images"))
+            await qdrant.aclose()
+            return results
+
+        document_ok, image_ok = asyncio.run(run())
+        assert document_ok is True, "Points in a successful upsert should report success"
+        assert image_ok is False, "Points in a failed upsert should report failure"
+
+    def test_aclose_sends_collected_and_queued_points(self):
+        """Test that aclose() during the batching window sends every pending point"""
+        async def run():
+            qdrant = await _connect(self.fake, batch_size=2, flush_interval=10)
+            tasks = [_add(qdrant, "documents") for _ in range(5)]
+            await asyncio.sleep(0.05)
+            await qdrant.aclose()
+            return await asyncio.wait_for(asyncio.gather(*tasks), 1)
+
+        results = asyncio.run(run())
+        assert results == [True] * 5, "Every pending add should resolve after aclose()"
+        sent = sum(len(orjson.loads(r.content)["points"]) for r in self.fake.upserts())
+        assert sent == 5, "Every pending point should be sent before closing"
+
+class TestSearchCache:
+    @pytest.fixture(autouse=True)
+    def _use_fake(self):
+        self.fake = FakeQdrant()
+
+    def _search(self, qdrant: QdrantClient):
+        return qdrant.search_documents(np.ones(DIMS["documents"]))
+
+    def test_hit_skips_request(self):
+        """Test that a repeated search is served from the cache"""
+        async def run():
+            qdrant = await _connect(self.fake)
+            first = await self._search(qdrant)
+            second = await self._search(qdrant)
+            await qdrant.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert len(self.fake.searches()) == 1, "A cache hit should not query Qdrant"
+        assert first == second, "A cache hit should return the same results"
+
+    def test_upsert_invalidates_cache(self, monkeypatch):
+        """Test that a write bumps the generation so the next search misses"""
+        monkeypatch.setattr(qdrant_client, "_WRITE_SETTLE_SECONDS", 0)
+
+        async def run():
+            qdrant = await _connect(self.fake)
+            await self._search(qdrant)
+            await _add(qdrant, "documents")
+            await self._search(qdrant)
+            await qdrant.aclose()
+
+        asyncio.run(run())
+        assert len(self.fake.searches()) == 2, "A search after a write should query Qdrant again"
+
+    def test_search_after_recent_write_is_not_cached(self, monkeypatch):
+        """Test that searches racing an unapplied write are not cached"""
+        monkeypatch.setattr(qdrant_client, "_WRITE_SETTLE_SECONDS", 10)
+
+        async def run():
+            qdrant = await _connect(self.fake)
+            await _add(qdrant, "documents")
+            await self._search(qdrant)
+            await self._search(qdrant)
+            await qdrant.aclose()
+
+        asyncio.run(run())
+        assert len(self.fake.searches()) == 2, "Searches within the settle window should not be cached"
+
+    def test_returned_results_do_not_alias_cache(self):
+        """Test that modifying returned results leaves the cached entry intact"""
+        async def run():
+            qdrant = await _connect(self.fake)
+            first = await self._search(qdrant)
+            first[0]["score"] = 0.0
+            first[0]["source_type"] = "text"
+            second = await self._search(qdrant)
+            await qdrant.aclose()
+            return second
+
+        second = asyncio.run(run())
+        assert len(self.fake.searches()) == 1, "The second search should be a cache hit"
+        assert second[0] == {"id": 1, "score": 0.9, "payload": {"text": "hit"}}, \
+            "Cached results should not change when a caller modifies its copy"
@@ -24,12 +24,23 @@ type SearchResult = {
   type: "text" | "image";
   score: number;
   text?: string;
-  image_data?: string;
+  image_src?: string;
   content_type?: string;
   filename?: string;
   description?: string;
 };
 
+// Images are served by the ml-service; older entries still carry inline base64 data
+const getImageSrc = (baseUrl: string, content: any) => {
+  if (content.uri) {
+    return `${baseUrl}${content.uri}`;
+  }
+  if (content.image_data) {
+    return `data:${content.metadata.content_type};base64,${content.image_data}`;
+  }
+  return undefined;
+};
+
 const getSizeClass = (size: ViewSize) => {
   switch (size) {
     case "small":
@@ -184,7 +195,7 @@ export default function Home() {
           type: result.source_type,
           score: result.score,
           text: result.source_type === "text" ? result.content.text : undefined,
-          image_data: result.source_type === "image" ? result.content.image_data : undefined,
+          image_src: result.source_type === "image" ? getImageSrc(baseUrl, result.content) : undefined,
           content_type: result.source_type === "image" ? result.content.metadata.content_type : undefined,
           filename: result.source_type === "image" ? result.content.metadata.filename : undefined,
           description: result.source_type === "image" ? result.content.metadata.description : undefined,
@@ -288,10 +299,10 @@ export default function Home() {
                   <div className="flex flex-col gap-4">
                     {result.type === "image" && (
                       <div className={`bg-muted rounded-lg overflow-hidden ${imageSize}`}>
-                        {result.image_data && (
+                        {result.image_src && (
                           // eslint-disable-next-line @next/next/no-img-element
                           <img 
-                            src={`data:${result.content_type};base64,${result.image_data}`} 
+                            src={result.image_src} 
                             alt={result.description || "No description"} 
                             className="w-full h-full object-cover"
                           />
@@ -327,10 +338,10 @@ export default function Home() {
                   <div className="flex gap-4">
                     {result.type === "image" && (
                       <div className={`shrink-0 bg-muted rounded-lg overflow-hidden w-${imageSize} ${imageSize}`}>
-                        {result.image_data && (
+                        {result.image_src && (
                           // eslint-disable-next-line @next/next/no-img-element
                           <img 
-                            src={`data:${result.content_type};base64,${result.image_data}`} 
+                            src={result.image_src} 
                             alt={result.description || "No description"} 
                             className="w-full h-full object-cover"
                           />
@@ -363,11 +374,11 @@ export default function Home() {
                 onClick={() => openInPanel(result)}
               >
                 <div className="flex gap-4 items-center">
-                  {result.type === "image" && result.image_data && (
+                  {result.type === "image" && result.image_src && (
                     <div className="shrink-0 bg-muted rounded-lg overflow-hidden w-12 h-12">
                       {/* eslint-disable-next-line @next/next/no-img-element */}
                       <img 
-                        src={`data:${result.content_type};base64,${result.image_data}`} 
+                        src={result.image_src} 
                         alt={result.description || "No description"} 
                         className="w-full h-full object-cover"
                       />
@@ -555,7 +566,7 @@ export default function Home() {
                   <div className="rounded-lg overflow-hidden bg-muted">
                     {/* eslint-disable-next-line @next/next/no-img-element */}
                     <img
-                      src={`data:${selectedResult.content_type};base64,${selectedResult.image_data}`}
+                      src={selectedResult.image_src}
                       alt={selectedResult.description || "No description"}
                       className="w-full h-auto object-contain"
                     />
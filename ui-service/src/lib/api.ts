@@ -7,6 +7,7 @@ export interface SearchResponse {
   content_type?: string;
   description?: string;
   image_data?: string;
+  image_url?: string;
 }
 
 export type SearchResult = SearchResponse & { type: "text" | "image" };
@@ -77,7 +78,8 @@ export async function searchContent(query: string, threshold: number = 0.1): Pro
       type: result.source_type as "text" | "image",
       text: result.content?.text,
       ...result.content?.metadata,
-      image_data: result.content?.image_data
+      image_data: result.content?.image_data,
+      image_url: result.content?.uri ? `${endpoint}${result.content.uri}` : undefined
     }));
   } catch (error) {
     console.error('Search error:', error);